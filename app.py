@@ -1,7 +1,7 @@
 import io
-import re
 import pandas as pd
 import streamlit as st
+from python_calamine import CalamineWorkbook
 
 st.set_page_config(
     page_title="Project Total Extractor",
@@ -18,50 +18,54 @@ st.write(
 # -----------------------------
 # Deterministic extraction logic
 # -----------------------------
-TOTAL_FOR_RE = re.compile(r"^\s*Total for\s*(.*)\s*$", re.IGNORECASE)
+TOTAL_FOR_PREFIX = "total for"
 
+@st.cache_data(show_spinner=False)
 def extract_project_totals(excel_bytes: bytes) -> pd.DataFrame:
     """
     Extract project totals deterministically:
     - Column A: 'Total for <Project Name>'
     - Column G: total amount
+
+    Results are cached on the workbook bytes, so reruns and re-uploads
+    of the same file skip parsing.
     """
-    df = pd.read_excel(
-        io.BytesIO(excel_bytes),
-        header=None,
-        engine="openpyxl"
-    )
+    workbook = CalamineWorkbook.from_filelike(io.BytesIO(excel_bytes))
+    sheet = workbook.get_sheet_by_index(0)
 
     results = []
 
-    for _, row in df.iterrows():
-        col_a = row.iloc[0] if len(row) > 0 else None
+    # iter_rows() starts at the used range, not A1. If that range begins
+    # right of Column A, Column A is empty and nothing can match.
+    start = sheet.start
+    rows = sheet.iter_rows() if start is not None and start[1] == 0 else []
+
+    for row in rows:
+        col_a = row[0] if row else None
 
         if isinstance(col_a, str):
-            match = TOTAL_FOR_RE.match(col_a)
-            if match:
-                project_name = match.group(1).strip()
-                total_amount = row.iloc[6] if len(row) > 6 else None
-
-                results.append({
-                    "Project Name": project_name,
-                    "Total Amount": total_amount
-                })
-
-    out_df = pd.DataFrame(results)
-
-    if not out_df.empty:
-        out_df["Total Amount"] = pd.to_numeric(
-            out_df["Total Amount"],
-            errors="coerce"
-        )
+            col_a = col_a.lstrip()
+            if col_a[:len(TOTAL_FOR_PREFIX)].casefold() == TOTAL_FOR_PREFIX:
+                project_name = col_a[len(TOTAL_FOR_PREFIX):].strip()
+                total_amount = row[6] if len(row) > 6 else None
+                # calamine returns every number as a float; turn whole
+                # values back into ints as pandas' Excel reader does.
+                if isinstance(total_amount, float) and total_amount.is_integer():
+                    total_amount = int(total_amount)
+                results.append((project_name, total_amount))
+
+    out_df = pd.DataFrame(results, columns=["Project Name", "Total Amount"])
+    out_df["Total Amount"] = pd.to_numeric(
+        out_df["Total Amount"],
+        errors="coerce"
+    )
 
     return out_df
 
 
 def dataframe_to_excel_bytes(df: pd.DataFrame) -> bytes:
     buffer = io.BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
         df.to_excel(
             writer,
             index=False,